@@ -10,6 +10,7 @@ from alpaca.trading.requests import MarketOrderRequest
 from alpaca.trading.enums import OrderSide, TimeInForce
 import time
 import hashlib
+from journal import Journal, journal_path
 
 # Load environment variables
 load_dotenv()
@@ -134,6 +135,19 @@ def make_trade(symbol, qty=1, take_profit_pct=1.01, stop_loss_pct=0.99):
     print(f"Bracket Order ID: {order.id}")
     print(f"Order Status: {order.status}")
 
+    # Record the order event alongside the strategy signals
+    with Journal(journal_path('orders', symbol)) as journal:
+        journal.order({
+            'id': str(order.id),
+            'symbol': symbol,
+            'side': 'buy',
+            'qty': qty,
+            'price': current_price,
+            'take_profit': take_profit_price,
+            'stop_loss': stop_loss_price,
+            'status': str(order.status),
+        })
+
     return order
 
 
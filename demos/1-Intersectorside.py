@@ -1,4 +1,5 @@
 import os
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -9,6 +10,8 @@ from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 from dotenv import load_dotenv
+from dashboard import Dashboard, scatter_signals
+from journal import Journal, journal_path, apply_signal
 
 # Load API credentials
 load_dotenv()
@@ -30,12 +33,12 @@ text_box = TextBox(ax_text, 'Symbol:', initial=current_symbol)
 ax_submit = fig.add_axes([0.66, 0.05, 0.1, 0.05])
 submit_btn = Button(ax_submit, 'Update')
 
-def fetch_stock_data(symbol):
+def fetch_stock_data(symbol, start=None):
     symbol = symbol.upper()
     request_params = StockBarsRequest(
         symbol_or_symbols=symbol,
         timeframe=TimeFrame.Day,
-        start=start_date,
+        start=start or start_date,
         end=end_date
     )
     bars = data_client.get_stock_bars(request_params)
@@ -51,38 +54,54 @@ def fetch_stock_data(symbol):
     return df
 
 def detect_crosses(stock_cum, sp500_cum):
-    crosses = []
-    for i in range(1, len(stock_cum)):
-        prev_diff = stock_cum.iloc[i - 1] - sp500_cum.iloc[i - 1]
-        curr_diff = stock_cum.iloc[i] - sp500_cum.iloc[i]
-        if prev_diff * curr_diff < 0:
-            crosses.append(i)
-    return crosses
-
-def intersection_algorithm(stock_cum, sp500_cum):
+    diff = np.asarray(stock_cum) - np.asarray(sp500_cum)
+    return [int(i) + 1 for i in np.nonzero(diff[:-1] * diff[1:] < 0)[0]]
+
+def intersection_algorithm(stock_cum, sp500_cum, state=None):
     stock_slope = np.gradient(stock_cum)
-    crosses = detect_crosses(stock_cum, sp500_cum)
+    crosses = set(detect_crosses(stock_cum, sp500_cum))
+    timestamps = stock_cum.index.as_unit('ns').asi8
+    # Plain arrays, this runs on every live bar in dashboard mode
+    stock = np.asarray(stock_cum)
+    sp500 = np.asarray(sp500_cum)
 
     last_cross_index = -1
     last_cross_was_below = None
     signals = []
     last_signal = None  # Ensure alternating signals
+    last_ts = None
+
+    # Resume from journaled state, only bars after the last processed one are evaluated
+    if state is not None:
+        if state.get('crossed'):
+            last_cross_index = 0
+        last_cross_was_below = state.get('last_cross_was_below')
+        last_signal = state.get('last_signal')
+        last_ts = state.get('last_ts')
+
+    # When resuming, leave the last two bars for the next run: the last one may
+    # still be in progress and its slope is one-sided, and the central slope of
+    # the one before depends on it, so deciding them now could differ from a full run
+    end = len(stock_cum) - 2 if state is not None else len(stock_cum)
+
+    for i in range(2, end):
+        if last_ts is not None and timestamps[i] <= last_ts:
+            continue
 
-    for i in range(2, len(stock_cum)):
         prev_slope = stock_slope[i - 2]
         curr_slope = stock_slope[i]
 
         # Track crossovers
         if i in crosses:
             last_cross_index = i
-            last_cross_was_below = stock_cum.iloc[i] < sp500_cum.iloc[i]
+            last_cross_was_below = bool(stock[i] < sp500[i])
 
         # BUY signal
         if (
             last_cross_index != -1 and
             last_cross_was_below and
             prev_slope < 0 and curr_slope > 0 and
-            stock_cum.iloc[i] < sp500_cum.iloc[i] and
+            stock[i] < sp500[i] and
             last_signal != 'BUY'
         ):
             signals.append(('BUY', i))
@@ -93,14 +112,89 @@ def intersection_algorithm(stock_cum, sp500_cum):
             last_cross_index != -1 and
             not last_cross_was_below and
             prev_slope > 0 and curr_slope < 0 and
-            stock_cum.iloc[i] > sp500_cum.iloc[i] and
+            stock[i] > sp500[i] and
             last_signal != 'SELL'
         ):
             signals.append(('SELL', i))
             last_signal = 'SELL'
 
+    if state is not None:
+        state['crossed'] = last_cross_index != -1
+        state['last_cross_was_below'] = last_cross_was_below
+        state['last_signal'] = last_signal
+        if end > 0:
+            state['last_ts'] = int(timestamps[end - 1])
+
     return signals
 
+def apply_intersection_signal(state, data):
+    """Replay fold: a BUY only fires below the S&P 500 after a cross, a SELL only above"""
+    state = apply_signal(state, data)
+    state['crossed'] = True
+    state['last_cross_was_below'] = data['signal'] == 'BUY'
+    return state
+
+def cumulative_returns(stock_data, sp500_data, anchor=None):
+    """
+    Cumulative % returns of the stock and the S&P 500. With an anchor
+    [timestamp, stock level, S&P level] both are shifted to those levels at that
+    bar, so they keep the origin of the run that saved the anchor.
+    """
+    stock_cum = np.cumsum(stock_data['close'].pct_change().fillna(0)) * 100
+    sp500_cum = np.cumsum(sp500_data['close'].pct_change().fillna(0)) * 100
+    if anchor is not None:
+        pos = stock_cum.index.get_loc(pd.Timestamp(anchor[0], tz=stock_cum.index.tz))
+        stock_cum += anchor[1] - stock_cum.iloc[pos]
+        sp500_cum += anchor[2] - sp500_cum.iloc[pos]
+    return stock_cum, sp500_cum
+
+def journaled_signals(symbol, stock_data, sp500_data):
+    """
+    Run intersection_algorithm on top of the journaled state for symbol, so the
+    alternation state survives restarts and only new bars are evaluated.
+    The fetch window moves forward on every restart, so cumulative returns are
+    anchored to the levels saved with the last processed bar; otherwise the
+    stock/S&P gap, and with it every cross, would shift between runs.
+    Returns (stock_cum, sp500_cum, signals) for the fetched window, signals
+    being all journaled signals that fall inside it.
+    """
+    window_start = stock_data.index[0]
+    with Journal(journal_path('intersectorside', symbol), fold=apply_intersection_signal) as journal:
+        state = journal.state
+        anchor = state.get('anchor')
+        if anchor is not None and np.searchsorted(stock_data.index.as_unit('ns').asi8, anchor[0]) < 2:
+            # The bar after the anchor needs two bars before the anchor for its
+            # slopes to match a full run. After a gap longer than the window, or
+            # when the window starts at the anchor, fetch from a week before it
+            fetch_start = pd.Timestamp(anchor[0], tz='UTC') - timedelta(days=7)
+            stock_data = fetch_stock_data(symbol, start=fetch_start)
+            sp500_data = fetch_stock_data('SPY', start=fetch_start)
+        if anchor is not None and anchor[0] not in stock_data.index.as_unit('ns').asi8:
+            print(f"Journal anchor for {symbol} not found in the bars, starting over")
+            state = {'signals': state.get('signals', [])}
+            anchor = None
+
+        stock_cum, sp500_cum = cumulative_returns(stock_data, sp500_data, anchor)
+        timestamps = stock_cum.index.as_unit('ns').asi8
+        for signal, idx in intersection_algorithm(stock_cum, sp500_cum, state):
+            record = [signal, int(timestamps[idx])]
+            if record not in state.setdefault('signals', []):
+                journal.signal({'signal': signal, 'ts': record[1]})
+                state['signals'].append(record)
+
+        if state.get('last_ts') is not None:
+            pos = stock_cum.index.get_loc(pd.Timestamp(state['last_ts'], tz=stock_cum.index.tz))
+            state['anchor'] = [state['last_ts'], float(stock_cum.iloc[pos]), float(sp500_cum.iloc[pos])]
+
+        # Keep the snapshot bounded to the plotted window
+        state['signals'] = [s for s in state.get('signals', []) if s[1] >= window_start.value]
+        journal.snapshot(state)
+
+    stock_cum = stock_cum[stock_cum.index >= window_start]
+    sp500_cum = sp500_cum[sp500_cum.index >= window_start]
+    positions = {ts: i for i, ts in enumerate(stock_cum.index.as_unit('ns').asi8)}
+    return stock_cum, sp500_cum, [(signal, positions[ts]) for signal, ts in state['signals'] if ts in positions]
+
 def update_plot(symbol):
     global current_symbol
     current_symbol = symbol.upper()
@@ -114,24 +208,16 @@ def update_plot(symbol):
         print(e)
         return
 
-    stock_returns = stock_data['close'].pct_change().fillna(0)
-    sp500_returns = sp500_data['close'].pct_change().fillna(0)
-
-    stock_cum = np.cumsum(stock_returns) * 100
-    sp500_cum = np.cumsum(sp500_returns) * 100
     dates = stock_data.index
 
-    # Get buy/sell signals using the encapsulated logic
-    signals = intersection_algorithm(stock_cum, sp500_cum)
+    # Get cumulative returns and buy/sell signals, resuming from the journal
+    stock_cum, sp500_cum, signals = journaled_signals(current_symbol, stock_data, sp500_data)
 
     # Plot cumulative returns
     ax1.plot(dates, stock_cum, label=f'{current_symbol} Cumulative Returns')
     ax1.plot(dates, sp500_cum, label='S&P 500 Cumulative Returns')
 
-    for signal, idx in signals:
-        color = 'green' if signal == 'BUY' else 'red'
-        ax1.plot(dates[idx], stock_cum.iloc[idx], 'o', color=color,
-                 label=signal if signal not in ax1.get_legend_handles_labels()[1] else "")
+    scatter_signals(ax1, dates, stock_cum, signals)
 
     ax1.set_title(f'{current_symbol} vs S&P 500 ({HISTORY} Days)')
     ax1.set_xlabel('Date')
@@ -143,10 +229,7 @@ def update_plot(symbol):
 
     # Plot price chart with signals
     ax2.plot(dates, stock_data['close'], label=f'{current_symbol} Price', color='blue')
-    for signal, idx in signals:
-        color = 'green' if signal == 'BUY' else 'red'
-        ax2.plot(dates[idx], stock_data['close'].iloc[idx], 'o', color=color,
-                 label=signal if signal not in ax2.get_legend_handles_labels()[1] else "")
+    scatter_signals(ax2, dates, stock_data['close'], signals)
 
     ax2.set_title(f'{current_symbol} Stock Price')
     ax2.set_xlabel('Date')
@@ -162,9 +245,26 @@ def update_plot(symbol):
 def handle_submit(text):
     update_plot(text.strip().upper())
 
-# Connect widget
-submit_btn.on_clicked(lambda event: handle_submit(text_box.text))
+def dashboard_series(symbol, closes):
+    """Cumulative returns vs the S&P 500 and their signals, recomputed as live bars arrive"""
+    stock = closes[symbol]
+    sp500 = closes['SPY'].reindex(stock.index, method='ffill')
+    stock_cum = np.cumsum(stock.pct_change().fillna(0)) * 100
+    sp500_cum = np.cumsum(sp500.pct_change().fillna(0)) * 100
+    signals = intersection_algorithm(stock_cum, sp500_cum)
+    lines = [(f'{symbol} Cumulative Returns', stock_cum), ('S&P 500 Cumulative Returns', sp500_cum)]
+    return lines, [(signal, stock_cum.index[idx], stock_cum.iloc[idx]) for signal, idx in signals]
+
+if len(sys.argv) > 1 and sys.argv[1] == '--dashboard':
+    # Watch many symbols live, e.g. python demos/1-Intersectorside.py --dashboard AAPL MSFT NVDA
+    plt.close(fig)
+    dashboard = Dashboard(sys.argv[2:] or [current_symbol], fetch_stock_data, dashboard_series,
+                          benchmarks=['SPY'], title='{symbol} vs S&P 500 Cumulative Return (%)')
+    dashboard.run(api_key, secret_key)
+else:
+    # Connect widget
+    submit_btn.on_clicked(lambda event: handle_submit(text_box.text))
 
-# Initial plot
-update_plot(current_symbol)
-plt.show()
+    # Initial plot
+    update_plot(current_symbol)
+    plt.show()
@@ -1,4 +1,5 @@
 import os
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -9,6 +10,8 @@ from alpaca.data.historical import StockHistoricalDataClient
 from alpaca.data.requests import StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 from dotenv import load_dotenv
+from dashboard import Dashboard, scatter_signals
+from journal import Journal, journal_path
 
 # Load API credentials
 load_dotenv()
@@ -50,7 +53,7 @@ def fetch_stock_data(symbol):
     df.index = pd.to_datetime(df.index)
     return df
 
-def weekly_threshold_strategy(df, buy_threshold=-0.05, sell_threshold=0.10):
+def weekly_threshold_strategy(df, buy_threshold=-0.05, sell_threshold=0.10, state=None):
     signals = []
     close_prices = df['close']
     dates = close_prices.index
@@ -58,10 +61,20 @@ def weekly_threshold_strategy(df, buy_threshold=-0.05, sell_threshold=0.10):
     # Filter for Mondays
     mondays = dates[dates.weekday == 0]
 
+    # Resume from journaled state, only Mondays after the last processed one are evaluated
+    last_ts = state.get('last_ts') if state is not None else None
+
+    # When resuming, the newest bar may still be in progress, leave it for the next run
+    if state is not None and len(mondays) and mondays[-1] == dates[-1]:
+        mondays = mondays[:-1]
+
     for i in range(1, len(mondays)):
         prev_monday = mondays[i - 1]
         this_monday = mondays[i]
 
+        if last_ts is not None and this_monday.value <= last_ts:
+            continue
+
         if prev_monday not in close_prices.index or this_monday not in close_prices.index:
             continue
 
@@ -76,8 +89,34 @@ def weekly_threshold_strategy(df, buy_threshold=-0.05, sell_threshold=0.10):
             idx = close_prices.index.get_loc(this_monday)
             signals.append(('SELL $10', idx))
 
+    if state is not None:
+        if signals:
+            state['last_signal'] = signals[-1][0]
+        if len(mondays):
+            state['last_ts'] = int(mondays[-1].value)
+
     return signals
 
+def journaled_signals(symbol, df):
+    """
+    Run weekly_threshold_strategy on top of the journaled state for symbol, so
+    only Mondays after the last run are evaluated.
+    Returns all journaled signals that fall inside the plotted window.
+    """
+    timestamps = df.index.as_unit('ns').asi8
+    with Journal(journal_path('tnbiggieriggy', symbol)) as journal:
+        state = journal.state
+        for signal, idx in weekly_threshold_strategy(df, state=state):
+            journal.signal({'signal': signal, 'ts': int(timestamps[idx])})
+            state.setdefault('signals', []).append([signal, int(timestamps[idx])])
+
+        # Keep the snapshot bounded to the plotted window
+        state['signals'] = [s for s in state.get('signals', []) if s[1] >= timestamps[0]]
+        journal.snapshot(state)
+
+    positions = {ts: i for i, ts in enumerate(timestamps)}
+    return [(signal, positions[ts]) for signal, ts in state['signals'] if ts in positions]
+
 def update_plot(symbol):
     global current_symbol
     current_symbol = symbol.upper()
@@ -94,16 +133,13 @@ def update_plot(symbol):
     stock_cum = np.cumsum(stock_returns) * 100
     dates = stock_data.index
 
-    # Get signals using weekly strategy
-    signals = weekly_threshold_strategy(stock_data)
+    # Get signals using weekly strategy, resuming from the journal
+    signals = journaled_signals(current_symbol, stock_data)
 
     # Plot cumulative returns
     ax1.plot(dates, stock_cum, label=f'{current_symbol} Cumulative Returns')
 
-    for signal, idx in signals:
-        color = 'green' if 'BUY' in signal else 'red'
-        ax1.plot(dates[idx], stock_cum.iloc[idx], 'o', color=color,
-                 label=signal if signal not in ax1.get_legend_handles_labels()[1] else "")
+    scatter_signals(ax1, dates, stock_cum, signals)
 
     ax1.set_title(f'{symbol} Weekly % Change Algorithm ({HISTORY} Days)')
     ax1.set_xlabel('Date')
@@ -115,10 +151,7 @@ def update_plot(symbol):
 
     # Plot price chart with signals
     ax2.plot(dates, stock_data['close'], label=f'{current_symbol} Price', color='blue')
-    for signal, idx in signals:
-        color = 'green' if 'BUY' in signal else 'red'
-        ax2.plot(dates[idx], stock_data['close'].iloc[idx], 'o', color=color,
-                 label=signal if signal not in ax2.get_legend_handles_labels()[1] else "")
+    scatter_signals(ax2, dates, stock_data['close'], signals)
 
     ax2.set_title(f'{symbol} Stock Price')
     ax2.set_xlabel('Date')
@@ -134,9 +167,24 @@ def update_plot(symbol):
 def handle_submit(text):
     update_plot(text.strip().upper())
 
-# Connect widget
-submit_btn.on_clicked(lambda event: handle_submit(text_box.text))
-
-# Initial plot
-update_plot(current_symbol)
-plt.show()
+def dashboard_series(symbol, closes):
+    """Cumulative returns and weekly threshold signals, recomputed as live bars arrive"""
+    stock = closes[symbol]
+    stock_cum = np.cumsum(stock.pct_change().fillna(0)) * 100
+    signals = weekly_threshold_strategy(pd.DataFrame({'close': stock}))
+    lines = [(f'{symbol} Cumulative Returns', stock_cum)]
+    return lines, [(signal, stock_cum.index[idx], stock_cum.iloc[idx]) for signal, idx in signals]
+
+if len(sys.argv) > 1 and sys.argv[1] == '--dashboard':
+    # Watch many symbols live, e.g. python demos/2-TNBiggieRiggy.py --dashboard AAPL MSFT NVDA
+    plt.close(fig)
+    dashboard = Dashboard(sys.argv[2:] or [current_symbol], fetch_stock_data, dashboard_series,
+                          title='{symbol} Weekly % Change Algorithm')
+    dashboard.run(api_key, secret_key)
+else:
+    # Connect widget
+    submit_btn.on_clicked(lambda event: handle_submit(text_box.text))
+
+    # Initial plot
+    update_plot(current_symbol)
+    plt.show()
@@ -0,0 +1,237 @@
+import os
+import operator
+import numpy as np
+import pandas as pd
+
+# Fundamentals for the whole universe, one row per symbol, text columns like
+# sector can be filtered with ==, e.g.
+# symbol,sector,roe,debt_to_equity,gross_margin,operating_margin,fcf,eps_growth_5y,revenue_growth_5y,pe,market_cap
+datadir = 'data/AllYouCanEatBuffet'
+FUNDAMENTALS_FILE = os.path.join(datadir, 'fundamentals.csv')
+TOP = 25
+
+def _compare(op):
+    """Comparison giving 1.0/0.0, or nan where either side is missing, works on numbers and text"""
+    def compare(left, right):
+        missing = np.asarray(pd.isna(left) | pd.isna(right))
+        present = ~missing
+        result = np.full(missing.shape, np.nan)
+        # Only compare present values, text can't be ordered against the nan marking a gap
+        result[present] = op(np.broadcast_to(left, missing.shape)[present],
+                             np.broadcast_to(right, missing.shape)[present])
+        return result
+    return compare
+
+def _and(left, right):
+    """False wins, otherwise missing stays missing"""
+    return np.where((left == 0) | (right == 0), 0.0, np.where(np.isnan(left) | np.isnan(right), np.nan, 1.0))
+
+def _or(left, right):
+    """True wins, otherwise missing stays missing"""
+    return np.where((left == 1) | (right == 1), 1.0, np.where(np.isnan(left) | np.isnan(right), np.nan, 0.0))
+
+class Expr:
+    """
+    Vectorized expression over fundamentals columns. Build them with col() and
+    the usual operators; comparisons give 1.0/0.0 masks that combine with & | ~,
+    nan where an input is missing, so missing data never passes a filter, negated or not.
+    key is a stable string used to cache results.
+    """
+    key = None
+
+    def evaluate(self, columns):
+        raise NotImplementedError
+
+    def _binary(self, other, op, symbol, reverse=False):
+        other = other if isinstance(other, Expr) else Const(other)
+        return BinOp(op, symbol, other, self) if reverse else BinOp(op, symbol, self, other)
+
+    def __add__(self, other): return self._binary(other, operator.add, '+')
+    def __radd__(self, other): return self._binary(other, operator.add, '+', reverse=True)
+    def __sub__(self, other): return self._binary(other, operator.sub, '-')
+    def __rsub__(self, other): return self._binary(other, operator.sub, '-', reverse=True)
+    def __mul__(self, other): return self._binary(other, operator.mul, '*')
+    def __rmul__(self, other): return self._binary(other, operator.mul, '*', reverse=True)
+    def __truediv__(self, other): return self._binary(other, operator.truediv, '/')
+    def __rtruediv__(self, other): return self._binary(other, operator.truediv, '/', reverse=True)
+    def __lt__(self, other): return self._binary(other, _compare(operator.lt), '<')
+    def __le__(self, other): return self._binary(other, _compare(operator.le), '<=')
+    def __gt__(self, other): return self._binary(other, _compare(operator.gt), '>')
+    def __ge__(self, other): return self._binary(other, _compare(operator.ge), '>=')
+    def __eq__(self, other): return self._binary(other, _compare(operator.eq), '==')
+    def __ne__(self, other): return self._binary(other, _compare(operator.ne), '!=')
+    def __and__(self, other): return self._binary(other, _and, '&')
+    def __or__(self, other): return self._binary(other, _or, '|')
+    def __invert__(self): return Not(self)
+    __hash__ = None
+
+class Col(Expr):
+    def __init__(self, name):
+        self.name = name
+        self.key = name
+
+    def evaluate(self, columns):
+        if self.name not in columns:
+            raise KeyError(f"Unknown fundamentals column: {self.name}")
+        return columns[self.name]
+
+class Const(Expr):
+    def __init__(self, value):
+        self.value = value
+        self.key = repr(value)
+
+    def evaluate(self, columns):
+        return self.value
+
+class BinOp(Expr):
+    def __init__(self, op, symbol, left, right):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.key = f"({left.key} {symbol} {right.key})"
+
+    def evaluate(self, columns):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return self.op(self.left.evaluate(columns), self.right.evaluate(columns))
+
+class Not(Expr):
+    def __init__(self, expr):
+        self.expr = expr
+        self.key = f"~{expr.key}"
+
+    def evaluate(self, columns):
+        # nan (missing) stays nan
+        return 1.0 - self.expr.evaluate(columns)
+
+class Rank(Expr):
+    """Percentile rank in [0, 1] across the universe, 1 = best; ties share their average rank, missing values rank as nan"""
+
+    def __init__(self, expr, ascending=False):
+        self.expr = expr
+        self.ascending = ascending
+        self.key = f"rank({expr.key}, ascending={ascending})"
+
+    def evaluate(self, columns):
+        values = np.asarray(self.expr.evaluate(columns), dtype=float)
+        count = np.count_nonzero(~np.isnan(values))
+        # 1 = best: the smallest value with ascending=True, the largest otherwise
+        positions = pd.Series(values).rank(method='average', ascending=self.ascending).to_numpy()
+        return 1 - (positions - 1) / max(count - 1, 1)
+
+def col(name):
+    return Col(name)
+
+def rank(expr, ascending=False):
+    """Rank expr so that higher values score higher (or lower values, with ascending=True)"""
+    return Rank(expr if isinstance(expr, Expr) else Const(expr), ascending)
+
+def all_of(*exprs):
+    """Combine filters with &"""
+    combined = exprs[0]
+    for expr in exprs[1:]:
+        combined = combined & expr
+    return combined
+
+class Screener:
+    """
+    Fundamentals for the universe as columnar numpy arrays. Filters and scores
+    are evaluated across all symbols at once, and results are cached until the
+    fundamentals file changes on disk.
+    """
+
+    def __init__(self, path=FUNDAMENTALS_FILE):
+        self.path = path
+        self.version = None
+        self.symbols = np.array([], dtype=object)
+        self.columns = {}
+        self.cache = {}
+
+    def load(self):
+        """(Re)load the fundamentals if the file changed since the last load"""
+        stat = os.stat(self.path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        if version == self.version:
+            return
+
+        df = pd.read_csv(self.path)
+        self.symbols = df.pop('symbol').str.upper().to_numpy()
+        self.columns = {}
+        for name in df.columns:
+            numbers = pd.to_numeric(df[name], errors='coerce')
+            if numbers.notna().any() or df[name].isna().all():
+                # Stray non-numeric entries in a numeric column count as missing
+                self.columns[name] = numbers.to_numpy(dtype=float)
+            else:
+                # Text columns like sector stay as objects, nan where missing
+                self.columns[name] = df[name].to_numpy(dtype=object)
+        self.cache.clear()
+        self.version = version
+
+    def screen(self, where=None, score=None, top=None):
+        """
+        Evaluate filter and score expressions across the universe.
+        Args:
+            where: Boolean expression, symbols where it is False or missing are dropped
+            score: Numeric expression to sort by (descending)
+            top: Keep only the best N symbols
+        Returns:
+            pandas.DataFrame with symbol and score columns
+        """
+        self.load()
+        key = (where.key if where is not None else None, score.key if score is not None else None, top)
+        if key in self.cache:
+            return self.cache[key].copy()
+
+        mask = np.ones(len(self.symbols), dtype=bool)
+        if where is not None:
+            mask &= np.broadcast_to(where.evaluate(self.columns), mask.shape) == 1
+
+        symbols = self.symbols[mask]
+        if score is not None:
+            scores = np.broadcast_to(score.evaluate(self.columns), mask.shape)[mask]
+            order = np.argsort(-np.nan_to_num(scores, nan=-np.inf), kind='stable')
+        else:
+            scores = np.full(len(symbols), np.nan)
+            order = np.arange(len(symbols))
+        if top is not None:
+            order = order[:top]
+
+        result = pd.DataFrame({'symbol': symbols[order], 'score': scores[order]})
+        self.cache[key] = result
+        return result.copy()
+
+# So good an idiot could run it: high returns on equity, wide margins, little
+# debt, growing earnings and real free cash flow, at a price that isn't silly
+BUFFET_FILTER = all_of(
+    col('roe') > 0.15,
+    col('debt_to_equity') < 0.5,
+    col('gross_margin') > 0.40,
+    col('operating_margin') > 0.15,
+    col('fcf') > 0,
+    col('eps_growth_5y') > 0.05,
+    col('revenue_growth_5y') > 0,
+    col('pe') > 0,
+    col('pe') < 35,
+)
+
+BUFFET_SCORE = (
+    rank(col('roe'))
+    + rank(col('gross_margin'))
+    + rank(col('fcf') / col('market_cap'))
+    + rank(col('eps_growth_5y'))
+    + rank(col('debt_to_equity'), ascending=True)
+    + rank(col('pe'), ascending=True)
+)
+
+def main():
+    if not os.path.exists(FUNDAMENTALS_FILE):
+        print(f"No fundamentals found, expected a CSV at {FUNDAMENTALS_FILE}")
+        return
+
+    screener = Screener(FUNDAMENTALS_FILE)
+    picks = screener.screen(BUFFET_FILTER, BUFFET_SCORE, top=TOP)
+    print(f"Top {len(picks)} of {len(screener.symbols)} symbols on the buffet screen:")
+    print(picks.to_string(index=False))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+import os
+import json
+import hashlib
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+import msgpack
+import pandas as pd
+import requests
+from alpaca.data.historical import StockHistoricalDataClient
+from alpaca.data.requests import StockBarsRequest
+from alpaca.data.timeframe import TimeFrame
+from dotenv import load_dotenv
+
+# Load API credentials
+load_dotenv()
+api_key = os.getenv('ALPACA_API_KEY')
+secret_key = os.getenv('ALPACA_SECRET_KEY')
+
+datadir = 'data/NewsFeels'
+HEADLINES_FILE = os.path.join(datadir, 'headlines.jsonl')
+NEWS_URL = os.getenv('NEWS_URL')  # e.g. http://localhost:8000/v1beta1/news
+HISTORY = 30
+WINDOW = '1D'
+BATCH_SIZE = 256
+
+# Small finance lexicon, enough to rank headlines as bullish/bearish
+POSITIVE_WORDS = {
+    'beat', 'beats', 'surge', 'surges', 'soar', 'soars', 'rally', 'rallies', 'gain', 'gains',
+    'record', 'upgrade', 'upgraded', 'growth', 'profit', 'profits', 'strong', 'raises', 'raised',
+    'outperform', 'bullish', 'buyback', 'approval', 'approved', 'win', 'wins', 'jump', 'jumps',
+    'rise', 'rises', 'higher', 'exceeds', 'expands', 'partnership', 'dividend',
+}
+NEGATIVE_WORDS = {
+    'miss', 'misses', 'plunge', 'plunges', 'drop', 'drops', 'fall', 'falls', 'slump', 'slumps',
+    'downgrade', 'downgraded', 'loss', 'losses', 'weak', 'cuts', 'cut', 'lawsuit', 'probe',
+    'recall', 'bearish', 'underperform', 'layoffs', 'fraud', 'decline', 'declines', 'lower',
+    'warning', 'warns', 'bankruptcy', 'default', 'delay', 'delayed', 'investigation', 'fine',
+}
+WORD_RE = re.compile(r"[a-z']+")
+
+class FileHeadlineSource:
+    """
+    Headlines from a local JSON lines file, one Alpaca-style news item per line:
+    {"created_at": "...", "symbols": ["AAPL"], "headline": "...", "summary": "..."}
+    Each fetch() only returns lines appended since the previous call.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offset = 0
+
+    def fetch(self):
+        if not os.path.exists(self.path):
+            return []
+        articles = []
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # partially written line, pick it up next time
+                self.offset += len(line)
+                if line.strip():
+                    articles.append(json.loads(line))
+        return articles
+
+class HTTPHeadlineSource:
+    """
+    Headlines from a server speaking the Alpaca news API shape ({"news": [...]}).
+    Each fetch() asks only for articles at or after the newest created_at seen
+    so far, the boundary ones that come back again are dropped by the pipeline's dedupe.
+    """
+
+    def __init__(self, url, symbols=None):
+        self.url = url
+        self.symbols = symbols
+        self.start = None
+        self.session = requests.Session()
+        self.session.headers.update({
+            'APCA-API-KEY-ID': api_key or '',
+            'APCA-API-SECRET-KEY': secret_key or '',
+        })
+
+    def fetch(self):
+        params = {'limit': 50, 'sort': 'asc'}
+        if self.symbols:
+            params['symbols'] = ','.join(self.symbols)
+        if self.start is not None:
+            params['start'] = self.start.isoformat()
+        articles = []
+        while True:
+            response = self.session.get(self.url, params=params, timeout=10)
+            response.raise_for_status()
+            payload = response.json()
+            articles.extend(payload.get('news', []))
+            token = payload.get('next_page_token')
+            if not token:
+                break
+            params['page_token'] = token
+
+        if articles:
+            newest = max(pd.Timestamp(article['created_at']) for article in articles)
+            self.start = newest if self.start is None else max(self.start, newest)
+        return articles
+
+def article_text(article):
+    return f"{article.get('headline', '')}\n{article.get('summary', '')}".strip().lower()
+
+def content_hash(article):
+    """Hash of the normalized headline + summary, so reposts of the same story dedupe"""
+    return hashlib.sha256(article_text(article).encode()).hexdigest()
+
+def lexicon_score(text):
+    """Sentiment in [-1, 1]: (positive - negative) / (positive + negative) word counts"""
+    words = WORD_RE.findall(text)
+    pos = sum(word in POSITIVE_WORDS for word in words)
+    neg = sum(word in NEGATIVE_WORDS for word in words)
+    if pos + neg == 0:
+        return 0.0
+    return (pos - neg) / (pos + neg)
+
+def score_batch(texts):
+    """Score a batch of texts, run on the worker pool"""
+    return [lexicon_score(text) for text in texts]
+
+class ScoreCache:
+    """
+    Content hash -> score for one scorer, persisted as an append-only msgpack
+    file named after the scorer, so switching scorers never reuses another
+    scorer's scores.
+    Args:
+        directory: Where the cache file lives
+        scorer: scorer(list of texts) -> list of scores, must be picklable
+        scorer_id: Name for the cache file, defaults to the scorer's __qualname__
+    """
+
+    def __init__(self, directory, scorer=score_batch, scorer_id=None):
+        if scorer_id is None:
+            scorer_id = getattr(scorer, '__qualname__', None)
+            if scorer_id is None or '<' in scorer_id:
+                raise ValueError(f"Scorer {scorer!r} has no stable name, pass scorer_id")
+        self.scorer = scorer
+        self.scorer_id = scorer_id
+        self.path = os.path.join(directory, f"scores_{scorer_id}.msgpack")
+        self.scores = {}
+        if os.path.exists(self.path):
+            self._load()
+
+    def _load(self):
+        end = 0
+        with open(self.path, 'rb') as f:
+            unpacker = msgpack.Unpacker(f, raw=False)
+            try:
+                for record in unpacker:
+                    if not (isinstance(record, list) and len(record) == 2 and isinstance(record[0], str)
+                            and isinstance(record[1], (int, float))):
+                        break  # not a [hash, score] pair, treat the rest as corrupt
+                    self.scores[record[0]] = record[1]
+                    end = unpacker.tell()
+            except ValueError:
+                pass  # corrupt tail, keep what was readable
+
+        if end < os.path.getsize(self.path):
+            # Drop a record cut short by a crash so new appends stay readable
+            with open(self.path, 'r+b') as f:
+                f.truncate(end)
+
+    def __contains__(self, key):
+        return key in self.scores
+
+    def __getitem__(self, key):
+        return self.scores[key]
+
+    def update(self, items):
+        with open(self.path, 'ab') as f:
+            for key, score in items:
+                f.write(msgpack.packb([key, score]))
+                self.scores[key] = score
+
+class NewsPipeline:
+    """
+    Ingest headlines from a source, dedupe them by content hash, score the
+    uncached ones in batches on a worker pool and keep one row per
+    (timestamp, symbol, score) for aggregation.
+    Args:
+        source: Object with fetch() -> list of Alpaca-style news dicts
+        cache: ScoreCache shared across runs, its scorer scores new articles
+        batch_size: Texts per worker task
+        workers: Worker processes (None = CPU count)
+    """
+
+    def __init__(self, source, cache, batch_size=BATCH_SIZE, workers=None):
+        self.source = source
+        self.cache = cache
+        self.batch_size = batch_size
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.seen = set()
+        self.rows = []
+
+    def ingest(self):
+        """Pull new headlines and score them, returns the number of new articles"""
+        articles = {}
+        for article in self.source.fetch():
+            key = content_hash(article)
+            if key not in self.seen and key not in articles:
+                articles[key] = article
+        self.seen.update(articles)
+
+        missing = [key for key in articles if key not in self.cache]
+        if missing:
+            batches = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+            texts = [[article_text(articles[key]) for key in batch] for batch in batches]
+            scored = []
+            for batch, scores in zip(batches, self.pool.map(self.cache.scorer, texts)):
+                scored.extend(zip(batch, scores))
+            self.cache.update(scored)
+
+        for key, article in articles.items():
+            timestamp = pd.Timestamp(article['created_at'])
+            timestamp = timestamp.tz_localize('UTC') if timestamp.tzinfo is None else timestamp.tz_convert('UTC')
+            for symbol in article.get('symbols', []):
+                self.rows.append((timestamp, symbol.upper(), self.cache[key]))
+
+        return len(articles)
+
+    def sentiment(self, window=WINDOW):
+        """Per-symbol rolling mean sentiment and article count over window"""
+        if not self.rows:
+            return pd.DataFrame(columns=['symbol', 'timestamp', 'sentiment', 'articles'])
+        scores = pd.DataFrame(self.rows, columns=['timestamp', 'symbol', 'score'])
+        scores = scores.set_index('timestamp').sort_index()
+        rolling = scores.groupby('symbol')['score'].rolling(window)
+        sentiment = pd.DataFrame({
+            'sentiment': rolling.mean(),
+            'articles': rolling.count(),
+        }).reset_index()
+        # rolling() emits a running row per article, the last one per timestamp covers all of them
+        return sentiment.groupby(['symbol', 'timestamp'], as_index=False).last()
+
+    def close(self):
+        self.pool.shutdown()
+
+def join_bars(bars, sentiment):
+    """Attach the latest rolling sentiment at or before each bar timestamp (no lookahead)"""
+    bars = bars.reset_index().sort_values('timestamp', kind='stable')
+    sentiment = sentiment.sort_values('timestamp', kind='stable')
+    return pd.merge_asof(bars, sentiment, on='timestamp', by='symbol', direction='backward')
+
+def fetch_stock_data(symbols):
+    data_client = StockHistoricalDataClient(api_key, secret_key)
+    end_date = datetime.now()
+    request_params = StockBarsRequest(
+        symbol_or_symbols=symbols,
+        timeframe=TimeFrame.Day,
+        start=end_date - timedelta(days=HISTORY),
+        end=end_date
+    )
+    df = data_client.get_stock_bars(request_params).df
+
+    if df.empty:
+        raise ValueError(f"No data for {symbols}")
+
+    return df
+
+def main():
+    os.makedirs(datadir, exist_ok=True)
+    source = HTTPHeadlineSource(NEWS_URL) if NEWS_URL else FileHeadlineSource(HEADLINES_FILE)
+    cache = ScoreCache(datadir)
+    pipeline = NewsPipeline(source, cache)
+
+    try:
+        count = pipeline.ingest()
+        print(f"Ingested {count} new headlines ({len(cache.scores)} scores cached)")
+
+        sentiment = pipeline.sentiment()
+        if sentiment.empty:
+            print("No headlines to score.")
+            return
+
+        symbols = sorted(sentiment['symbol'].unique())
+        joined = join_bars(fetch_stock_data(symbols), sentiment)
+        for symbol, rows in joined.groupby('symbol'):
+            print(f"\n{symbol}")
+            print(rows[['timestamp', 'close', 'sentiment', 'articles']].tail())
+    finally:
+        pipeline.close()
+
+if __name__ == "__main__":
+    main()
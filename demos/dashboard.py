@@ -0,0 +1,179 @@
+"""
+Live multi-symbol dashboard for the strategy demos.
+
+Each symbol gets its own axes with persistent line artists and a single scatter
+for its signal markers. Minute bars from Alpaca's stream update the current
+daily bar (or append a new one) and only the changed artists are redrawn with
+blitting; a full redraw only happens when data leaves the current axis limits.
+"""
+import math
+import queue
+import threading
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+from alpaca.data.live import StockDataStream
+
+MARKET_TZ = 'America/New_York'
+
+def signal_color(signal):
+    return 'green' if 'BUY' in signal else 'red'
+
+def scatter_signals(ax, x, y, signals):
+    """Mark (label, position) signals on ax at x[position], y[position], one legend entry per label"""
+    for signal in dict.fromkeys(signal for signal, _ in signals):
+        idx = [i for label, i in signals if label == signal]
+        ax.scatter(x[idx], y.iloc[idx], color=signal_color(signal), label=signal, zorder=3)
+
+class Dashboard:
+    """
+    Args:
+        symbols: Symbols to chart, one axes each
+        fetch: fetch(symbol) -> DataFrame of daily bars with a 'close' column
+        compute: compute(symbol, closes) -> (lines, signals) where closes maps
+                 every tracked symbol to its daily close Series, lines is a
+                 list of (label, Series) and signals a list of (label, timestamp, value)
+        benchmarks: Symbols the charts are computed against, streamed and passed
+                    to compute, charted as well only if also in symbols
+        title: Axes title, formatted with symbol
+        interval: Milliseconds between redraws
+    """
+
+    def __init__(self, symbols, fetch, compute, benchmarks=(), title='{symbol}', interval=1000):
+        self.symbols = [symbol.upper() for symbol in symbols]
+        self.benchmarks = [symbol.upper() for symbol in benchmarks]
+        self.tracked = list(dict.fromkeys(self.symbols + self.benchmarks))
+        self.compute = compute
+        self.updates = queue.SimpleQueue()
+        self.closes = {symbol: fetch(symbol)['close'].copy() for symbol in self.tracked}
+
+        columns = min(len(self.symbols), 2)
+        rows = math.ceil(len(self.symbols) / columns)
+        self.fig, axes = plt.subplots(rows, columns, figsize=(7 * columns, 4 * rows), squeeze=False)
+        for ax in axes.flat[len(self.symbols):]:
+            ax.set_visible(False)
+
+        self.axes = dict(zip(self.symbols, axes.flat))
+        self.lines = {symbol: {} for symbol in self.symbols}
+        self.markers = {}
+        for symbol, ax in self.axes.items():
+            ax.set_title(title.format(symbol=symbol))
+            ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
+            self.markers[symbol] = ax.scatter([], [], s=30, zorder=3, animated=True)
+            self._update(symbol)
+            ax.legend(loc='upper left', fontsize='small')
+            self._rescale(ax)
+        self.fig.tight_layout()
+
+        self.background = None
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        self.timer = self.fig.canvas.new_timer(interval=interval)
+        self.timer.add_callback(self._refresh)
+
+    def _artists(self):
+        for symbol in self.symbols:
+            yield from self.lines[symbol].values()
+            yield self.markers[symbol]
+
+    def _on_draw(self, event):
+        self.background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._artists():
+            self.fig.draw_artist(artist)
+
+    def _update(self, symbol):
+        """Recompute symbol and push the new data into its artists, returns False if it no longer fits the axes"""
+        ax = self.axes[symbol]
+        lines, signals = self.compute(symbol, self.closes)
+
+        for label, series in lines:
+            x = mdates.date2num(series.index.to_pydatetime())
+            if label not in self.lines[symbol]:
+                self.lines[symbol][label], = ax.plot(x, series.to_numpy(), label=label, animated=True)
+            else:
+                self.lines[symbol][label].set_data(x, series.to_numpy())
+
+        markers = self.markers[symbol]
+        if signals:
+            labels, timestamps, values = zip(*signals)
+            x = mdates.date2num(pd.DatetimeIndex(timestamps).to_pydatetime())
+            markers.set_offsets(np.column_stack([x, values]))
+            markers.set_facecolors([signal_color(label) for label in labels])
+        else:
+            markers.set_offsets(np.empty((0, 2)))
+
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        for line in self.lines[symbol].values():
+            x, y = line.get_data()
+            if len(x) and (x[-1] > x1 or np.nanmin(y) < y0 or np.nanmax(y) > y1):
+                return False
+        return True
+
+    def _rescale(self, ax):
+        ax.relim()
+        ax.autoscale_view()
+        # Leave headroom on the right so appended bars don't force a redraw every day
+        x0, x1 = ax.get_xlim()
+        ax.set_xlim(x0, x1 + 5)
+
+    def on_bar(self, bar):
+        """Stream handler, runs on the stream thread so only queue the bar"""
+        self.updates.put((bar.symbol, pd.Timestamp(bar.timestamp), bar.close))
+
+    def _apply(self, symbol, timestamp, close):
+        """Fold a minute bar into the daily closes, updating today's bar or appending a new one"""
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.tz_localize('UTC')
+        closes = self.closes[symbol]
+        day = timestamp.tz_convert(MARKET_TZ).normalize().tz_convert(closes.index.tz or 'UTC')
+        if closes.index.tz is None:
+            day = day.tz_localize(None)
+        if len(closes) and day < closes.index[-1]:
+            return
+        if len(closes) and day == closes.index[-1]:
+            closes.iloc[-1] = close
+        else:
+            self.closes[symbol] = pd.concat([closes, pd.Series([close], index=[day])])
+
+    def _refresh(self):
+        dirty = set()
+        while True:
+            try:
+                symbol, timestamp, close = self.updates.get_nowait()
+            except queue.Empty:
+                break
+            if symbol not in self.closes:
+                continue
+            self._apply(symbol, timestamp, close)
+            # A benchmark moves every chart that is computed against it, its own included
+            dirty.update(self.symbols if symbol in self.benchmarks else [symbol])
+
+        if not dirty:
+            return
+
+        rescale = [symbol for symbol in dirty if not self._update(symbol)]
+        if rescale or self.background is None:
+            for symbol in rescale:
+                self._rescale(self.axes[symbol])
+            self.fig.canvas.draw()
+            return
+
+        canvas = self.fig.canvas
+        canvas.restore_region(self.background)
+        for artist in self._artists():
+            self.fig.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+    def run(self, api_key, secret_key):
+        """Stream minute bars on a background thread and show the dashboard"""
+        stream = StockDataStream(api_key, secret_key)
+
+        async def handler(bar):
+            self.on_bar(bar)
+
+        stream.subscribe_bars(handler, *self.tracked)
+        threading.Thread(target=stream.run, daemon=True).start()
+        self.timer.start()
+        plt.show()
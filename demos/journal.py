@@ -0,0 +1,144 @@
+"""
+Append-only msgpack journal of strategy signals, state snapshots and orders.
+
+Every record is a msgpack map {'kind': ..., 'ts': ..., 'data': ...} appended to
+data/journal/<strategy>_<SYMBOL>.msgpack. A sidecar .idx file holds the byte
+offset of the latest snapshot, so on restart only the records written after it
+are read back, no matter how much history the journal holds.
+"""
+import os
+import struct
+import time
+import msgpack
+
+datadir = 'data/journal'
+
+SIGNAL = 'signal'
+SNAPSHOT = 'snapshot'
+ORDER = 'order'
+
+_OFFSET = struct.Struct('<Q')
+
+def journal_path(strategy, symbol):
+    """Ensure data/journal exists and return the journal file for strategy/symbol"""
+    os.makedirs(datadir, exist_ok=True)
+    return os.path.join(datadir, f"{strategy}_{symbol.upper()}.msgpack")
+
+def is_record(record):
+    """True for a decoded journal record, not a stray value read from inside one"""
+    return isinstance(record, dict) and 'kind' in record and 'data' in record
+
+def apply_signal(state, data):
+    """Default replay fold: remember the signal as the latest one and keep it for plotting"""
+    state['last_signal'] = data['signal']
+    state['last_ts'] = data['ts']
+    state.setdefault('signals', []).append([data['signal'], data['ts']])
+    return state
+
+class Journal:
+    """
+    Restore strategy state from the last snapshot, then append new records.
+    Args:
+        path: Journal file (see journal_path)
+        fold: fold(state, data) -> state, applied to each signal written after
+              the last snapshot while replaying
+    """
+
+    def __init__(self, path, fold=apply_signal):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.fold = fold
+        self.state = {}
+        self.orders = []
+        self._replay()
+        self._file = open(self.path, 'ab')
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, 'rb') as f:
+                return _OFFSET.unpack(f.read(_OFFSET.size))[0]
+        except (OSError, struct.error):
+            return 0
+
+    def _write_index(self, offset):
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(_OFFSET.pack(offset))
+        os.replace(tmp_path, self.index_path)
+
+    def _scan(self, offset):
+        """Read records from offset, returning (records with their offsets, end of last complete record)"""
+        records = []
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            unpacker = msgpack.Unpacker(f, raw=False)
+            start = offset
+            try:
+                for record in unpacker:
+                    records.append((start, record))
+                    start = offset + unpacker.tell()
+            except ValueError:
+                pass  # corrupt tail, keep what was readable
+        return records, start
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        size = os.path.getsize(self.path)
+
+        offset = self._read_index()
+        records, end = self._scan(offset) if offset < size else ([], offset)
+        if offset and (not records or not is_record(records[0][1]) or records[0][1]['kind'] != SNAPSHOT):
+            # Stale index, fall back to a full scan
+            records, end = self._scan(0)
+
+        for start, record in records:
+            if not is_record(record):
+                continue
+            kind = record['kind']
+            if kind == SNAPSHOT:
+                self.state = record['data']
+                self.orders = []
+                if start != offset:
+                    self._write_index(start)
+            elif kind == SIGNAL and self.fold is not None:
+                self.state = self.fold(self.state, record['data'])
+            elif kind == ORDER:
+                self.orders.append(record['data'])
+
+        if end < size:
+            # Drop a record cut short by a crash so new appends stay readable
+            with open(self.path, 'r+b') as f:
+                f.truncate(end)
+
+    def _append(self, kind, data):
+        offset = self._file.tell()
+        self._file.write(msgpack.packb({'kind': kind, 'ts': time.time_ns(), 'data': data}, use_bin_type=True))
+        self._file.flush()
+        return offset
+
+    def signal(self, data):
+        """Append a strategy signal, e.g. {'signal': 'BUY', 'ts': <bar time in ns>}"""
+        self._append(SIGNAL, data)
+
+    def order(self, data):
+        """Append an order event"""
+        self._append(ORDER, data)
+        self.orders.append(data)
+
+    def snapshot(self, state):
+        """Append a full state snapshot and point the index at it"""
+        offset = self._append(SNAPSHOT, state)
+        os.fsync(self._file.fileno())
+        self._write_index(offset)
+        self.state = state
+        self.orders = []
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
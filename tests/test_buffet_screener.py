@@ -0,0 +1,69 @@
+import importlib.util
+import os
+import numpy as np
+import pytest
+
+DEMOS = os.path.join(os.path.dirname(__file__), '..', 'demos')
+
+spec = importlib.util.spec_from_file_location('buffet', os.path.join(DEMOS, '3-All_You_Can_Eat_Buffet.py'))
+buffet = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(buffet)
+col, rank = buffet.col, buffet.rank
+
+
+@pytest.fixture
+def screener(tmp_path):
+    path = tmp_path / 'fundamentals.csv'
+    path.write_text(
+        'symbol,roe,pe\n'
+        'aaa,0.20,10\n'
+        'bbb,0.05,10\n'
+        'ccc,,10\n'
+        'ddd,0.30,20\n'
+    )
+    return buffet.Screener(str(path))
+
+
+def test_negated_filter_drops_missing(screener):
+    assert screener.screen(col('roe') > 0.1)['symbol'].tolist() == ['AAA', 'DDD']
+    assert screener.screen(~(col('roe') > 0.1))['symbol'].tolist() == ['BBB']
+
+
+def test_rank_ties_share_a_rank(screener):
+    scores = screener.screen(score=rank(col('pe'), ascending=True))
+    assert scores['symbol'].tolist() == ['AAA', 'BBB', 'CCC', 'DDD']
+    np.testing.assert_allclose(scores['score'], [2 / 3, 2 / 3, 2 / 3, 0])
+
+
+def test_screen_returns_a_copy(screener):
+    result = screener.screen(col('roe') > 0.1, col('roe'))
+    result.loc[0, 'symbol'] = 'ZZZ'
+    result.drop(index=1, inplace=True)
+    assert screener.screen(col('roe') > 0.1, col('roe'))['symbol'].tolist() == ['DDD', 'AAA']
+
+
+def test_rewritten_file_clears_cache(screener):
+    assert screener.screen(col('roe') > 0.1)['symbol'].tolist() == ['AAA', 'DDD']
+    stat = os.stat(screener.path)
+    with open(screener.path, 'w') as f:
+        f.write('symbol,roe,pe\naaa,0.01,10\nbbb,0.50,10\nccc,,10\nddd,0.01,20\n')
+    # Same size, so only the mtime tells the two versions apart
+    os.utime(screener.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert screener.screen(col('roe') > 0.1)['symbol'].tolist() == ['BBB']
+
+
+def test_text_columns_compare_as_text(tmp_path):
+    path = tmp_path / 'fundamentals.csv'
+    path.write_text(
+        'symbol,sector,roe\n'
+        'aaa,Technology,0.20\n'
+        'bbb,Energy,0.30\n'
+        'ccc,,0.40\n'
+        'ddd,Technology,0.05\n'
+    )
+    screener = buffet.Screener(str(path))
+    tech = col('sector') == 'Technology'
+    assert screener.screen(tech)['symbol'].tolist() == ['AAA', 'DDD']
+    assert screener.screen(~tech)['symbol'].tolist() == ['BBB']
+    assert screener.screen(tech & (col('roe') > 0.1))['symbol'].tolist() == ['AAA']
+    assert screener.screen(col('sector') < 'F')['symbol'].tolist() == ['BBB']
@@ -0,0 +1,93 @@
+import ast
+import os
+import sys
+from datetime import timedelta
+import msgpack
+import numpy as np
+import pandas as pd
+import pytest
+
+DEMOS = os.path.join(os.path.dirname(__file__), '..', 'demos')
+sys.path.insert(0, DEMOS)
+
+import journal
+
+WINDOW = 63  # ~90 calendar days of daily bars
+
+
+def load_functions(filename, names, **namespace):
+    """Pull the strategy functions out of a demo script without running its plotting code"""
+    with open(os.path.join(DEMOS, filename)) as f:
+        tree = ast.parse(f.read())
+    namespace.update(np=np, pd=pd, timedelta=timedelta, Journal=journal.Journal,
+                     journal_path=journal.journal_path, apply_signal=journal.apply_signal)
+    nodes = [node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name in names]
+    exec(compile(ast.Module(nodes, []), filename, 'exec'), namespace)
+    return namespace
+
+
+def synthetic_bars(seed, count):
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2023-01-02', periods=count, freq='B', tz='America/New_York').tz_convert('UTC')
+    stock = pd.DataFrame({'close': 100 * np.exp(np.cumsum(rng.normal(0, 0.02, count)))}, index=index)
+    sp500 = pd.DataFrame({'close': 400 * np.exp(np.cumsum(rng.normal(0, 0.008, count)))}, index=index)
+    return stock, sp500
+
+
+@pytest.fixture
+def intersectorside(tmp_path, monkeypatch):
+    monkeypatch.setattr(journal, 'datadir', str(tmp_path))
+    return load_functions('1-Intersectorside.py', {
+        'detect_crosses', 'intersection_algorithm', 'apply_intersection_signal',
+        'cumulative_returns', 'journaled_signals',
+    })
+
+
+def resumed_signals(ns, stock, sp500, ends):
+    """Restart once per entry in ends, each time fetching the WINDOW bars before it"""
+    for end in ends:
+        def fetch_stock_data(symbol, start=None, end=end):
+            data = (sp500 if symbol == 'SPY' else stock).iloc[:end]
+            return data[data.index >= start]
+
+        ns['fetch_stock_data'] = fetch_stock_data
+        start = max(0, end - WINDOW)
+        ns['journaled_signals']('TEST', stock.iloc[start:end], sp500.iloc[start:end])
+
+    with open(journal.journal_path('intersectorside', 'TEST'), 'rb') as f:
+        records = list(msgpack.Unpacker(f, raw=False))
+    return [(record['data']['signal'], pd.Timestamp(record['data']['ts'], tz='UTC'))
+            for record in records if record['kind'] == journal.SIGNAL]
+
+
+def full_signals(ns, stock, sp500, end):
+    """Single run over all history from the journal's origin, minus the bars a resume defers"""
+    stock_cum, sp500_cum = ns['cumulative_returns'](stock.iloc[:end], sp500.iloc[:end])
+    return [(signal, stock_cum.index[idx])
+            for signal, idx in ns['intersection_algorithm'](stock_cum, sp500_cum)
+            if idx < end - 2]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_daily_sliding_window_resume_matches_full_run(intersectorside, seed):
+    stock, sp500 = synthetic_bars(seed, WINDOW + 50)
+    ends = range(WINDOW, WINDOW + 51)
+    assert resumed_signals(intersectorside, stock, sp500, ends) == full_signals(intersectorside, stock, sp500, ends[-1])
+
+
+# 36, 66 and 82 lost signals right after the anchor when the refetch started at it
+@pytest.mark.parametrize('seed', [0, 1, 2, 3, 4, 36, 66, 82])
+def test_resume_after_gap_longer_than_window(intersectorside, seed):
+    stock, sp500 = synthetic_bars(seed, 3 * WINDOW)
+    ends = [WINDOW, 3 * WINDOW]
+    assert resumed_signals(intersectorside, stock, sp500, ends) == full_signals(intersectorside, stock, sp500, ends[-1])
+
+
+# The first run anchors at bar WINDOW - 3, so the second window starts on the
+# anchor (+60) or one bar after it (+61); these seeds used to lose signals there
+@pytest.mark.parametrize('offset', [60, 61])
+@pytest.mark.parametrize('seed', [46, 128, 129])
+def test_resume_when_window_starts_at_anchor(intersectorside, seed, offset):
+    stock, sp500 = synthetic_bars(seed, WINDOW + offset)
+    ends = [WINDOW, WINDOW + offset]
+    assert resumed_signals(intersectorside, stock, sp500, ends) == full_signals(intersectorside, stock, sp500, ends[-1])
@@ -0,0 +1,47 @@
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'demos'))
+
+import journal
+
+
+@pytest.fixture
+def path(tmp_path, monkeypatch):
+    monkeypatch.setattr(journal, 'datadir', str(tmp_path))
+    path = journal.journal_path('test', 'aapl')
+    with journal.Journal(path) as j:
+        j.signal({'signal': 'BUY', 'ts': 1})
+        j.snapshot({'last_ts': 5, 'signals': []})
+        j.signal({'signal': 'SELL', 'ts': 7})
+        j.order({'id': 'a'})
+    return path
+
+
+EXPECTED = {'last_ts': 7, 'last_signal': 'SELL', 'signals': [['SELL', 7]]}
+
+
+def test_replay_from_last_snapshot(path):
+    with journal.Journal(path) as j:
+        assert j.state == EXPECTED
+        assert j.orders == [{'id': 'a'}]
+
+
+def test_stale_index_falls_back_to_full_scan(path):
+    for offset in range(1, os.path.getsize(path) + 4):
+        with open(path + '.idx', 'wb') as f:
+            f.write(journal._OFFSET.pack(offset))
+        with journal.Journal(path) as j:
+            assert j.state == EXPECTED, offset
+
+
+def test_truncated_tail_is_dropped(path):
+    with open(path, 'ab') as f:
+        f.write(b'\x83\xa4kind')
+    with journal.Journal(path) as j:
+        assert j.state == EXPECTED
+        j.signal({'signal': 'BUY', 'ts': 9})
+    with journal.Journal(path) as j:
+        assert j.state['last_signal'] == 'BUY'
+        assert j.state['signals'] == [['SELL', 7], ['BUY', 9]]
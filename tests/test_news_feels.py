@@ -0,0 +1,148 @@
+import importlib.util
+import os
+import sys
+import types
+import pandas as pd
+import pytest
+
+DEMOS = os.path.join(os.path.dirname(__file__), '..', 'demos')
+
+
+@pytest.fixture
+def news_feels(monkeypatch):
+    """Import the demo with the Alpaca client and dotenv stubbed out, no network needed"""
+    stubs = {
+        'alpaca': {},
+        'alpaca.data': {},
+        'alpaca.data.historical': {'StockHistoricalDataClient': None},
+        'alpaca.data.requests': {'StockBarsRequest': None},
+        'alpaca.data.timeframe': {'TimeFrame': None},
+        'dotenv': {'load_dotenv': lambda: None},
+    }
+    for name, attrs in stubs.items():
+        module = types.ModuleType(name)
+        module.__dict__.update(attrs)
+        monkeypatch.setitem(sys.modules, name, module)
+
+    spec = importlib.util.spec_from_file_location('news_feels', os.path.join(DEMOS, '4-News_Feels.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def article(created_at, headline, symbols=('AAPL',)):
+    return {'created_at': created_at, 'symbols': list(symbols), 'headline': headline, 'summary': ''}
+
+
+class ListSource:
+    def __init__(self, articles):
+        self.articles = articles
+
+    def fetch(self):
+        articles, self.articles = self.articles, []
+        return articles
+
+
+def test_cache_truncates_broken_tail(news_feels, tmp_path):
+    cache = news_feels.ScoreCache(tmp_path)
+    cache.update([('a' * 64, 0.5), ('b' * 64, -1.0)])
+    with open(cache.path, 'ab') as f:
+        f.write(b'\x92\xd9\x40abc')  # [hash, score] cut off inside the hash
+
+    cache = news_feels.ScoreCache(tmp_path)
+    assert cache.scores == {'a' * 64: 0.5, 'b' * 64: -1.0}
+    cache.update([('c' * 64, 1.0)])
+
+    cache = news_feels.ScoreCache(tmp_path)
+    assert cache.scores == {'a' * 64: 0.5, 'b' * 64: -1.0, 'c' * 64: 1.0}
+
+
+def test_cache_file_per_scorer(news_feels, tmp_path):
+    def shouty(texts):
+        return [1.0 for _ in texts]
+
+    news_feels.ScoreCache(tmp_path).update([('a' * 64, 0.5)])
+    assert 'a' * 64 not in news_feels.ScoreCache(tmp_path, shouty, scorer_id='shouty')
+    with pytest.raises(ValueError):
+        news_feels.ScoreCache(tmp_path, shouty)
+
+
+def test_sentiment_one_row_per_timestamp(news_feels, tmp_path):
+    articles = [
+        article('2024-05-01T13:00:00Z', 'apple beats'),
+        article('2024-05-01T13:00:00Z', 'apple falls'),
+        article('2024-05-01T13:00:00Z', 'apple rallies'),
+        article('2024-05-01T14:00:00Z', 'apple cuts'),
+    ]
+    cache = news_feels.ScoreCache(tmp_path)
+    # Pre-score everything so ingest() never needs the worker pool
+    cache.update((news_feels.content_hash(a), news_feels.lexicon_score(news_feels.article_text(a)))
+                 for a in articles)
+    pipeline = news_feels.NewsPipeline(ListSource(articles), cache, workers=1)
+    try:
+        assert pipeline.ingest() == 4
+        sentiment = pipeline.sentiment()
+    finally:
+        pipeline.close()
+
+    assert not sentiment.duplicated(['symbol', 'timestamp']).any()
+    assert sentiment['articles'].tolist() == [3, 4]
+    assert sentiment['sentiment'].iloc[0] == pytest.approx(1 / 3)
+    assert sentiment['sentiment'].iloc[1] == pytest.approx(0)
+
+
+def test_join_bars_has_no_lookahead(news_feels):
+    timestamps = pd.to_datetime(['2024-05-01T13:00Z', '2024-05-01T15:00Z', '2024-05-02T13:00Z'])
+    sentiment = pd.DataFrame({
+        'symbol': ['AAPL'] * 3,
+        'timestamp': timestamps,
+        'sentiment': [0.5, -0.5, 1.0],
+        'articles': [1, 2, 3],
+    })
+    bars = pd.DataFrame({
+        'symbol': ['AAPL'] * 4,
+        'timestamp': pd.to_datetime(['2024-05-01T12:00Z', '2024-05-01T13:00Z',
+                                     '2024-05-01T14:00Z', '2024-05-02T12:00Z']),
+        'close': [1.0, 2.0, 3.0, 4.0],
+    }).set_index(['symbol', 'timestamp'])
+
+    joined = news_feels.join_bars(bars, sentiment)
+    assert joined['articles'].tolist()[1:] == [1, 1, 2]
+    assert pd.isna(joined['articles'].iloc[0])
+    for _, row in joined.dropna().iterrows():
+        latest = sentiment[sentiment['timestamp'] <= row['timestamp']].iloc[-1]
+        assert row['sentiment'] == latest['sentiment']
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+def test_http_source_resumes_from_newest_article(news_feels):
+    source = news_feels.HTTPHeadlineSource('http://news.test/v1beta1/news')
+    pages = [
+        {'news': [article('2024-05-01T13:00:00Z', 'one')], 'next_page_token': 'p2'},
+        {'news': [article('2024-05-01T14:30:00Z', 'two')], 'next_page_token': None},
+        {'news': [], 'next_page_token': None},
+    ]
+    calls = []
+
+    def get(url, params, timeout):
+        calls.append(dict(params))
+        return FakeResponse(pages.pop(0))
+
+    source.session.get = get
+    assert len(source.fetch()) == 2
+    assert 'start' not in calls[0]
+    assert calls[1]['page_token'] == 'p2'
+
+    assert source.fetch() == []
+    assert pd.Timestamp(calls[2]['start']) == pd.Timestamp('2024-05-01T14:30:00Z')
+    assert 'page_token' not in calls[2]